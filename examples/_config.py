@@ -0,0 +1,47 @@
+"""示例脚本共用的配置读取模块。
+
+函数说明：
+load_config()函数用于读取配置文件中的一卡通号和密码，同一配置文件只解析一次，之后直接返回缓存结果。
+示例脚本中的请求都不校验证书，导入本模块时会关闭InsecureRequestWarning（只影响示例脚本，不影响作为库导入的seu_auth）。
+
+使用方法：
+1. 配置账户信息：在`config.ini`中填入一卡通号和密码（不需要引号），也可另建`local_config.ini`（优先读取）；
+2. 在示例脚本中导入load_config()函数，调用后得到一卡通号和密码。
+
+Author: Golevka2001 (https://github.com/Golevka2001)
+Email: gol3vka@163.com
+Date: 2026/10/15
+License: GPL-3.0 License
+"""
+
+import configparser
+import functools
+import os
+
+import urllib3
+
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+
+def load_config(config_file_name: str = ''):
+    """读取配置文件中的账户信息。
+
+    Args:
+        config_file_name: 配置文件路径，未提供时优先使用`local_config.ini`，不存在则使用`config.ini`
+
+    Returns:
+        username: 一卡通号
+        password: 统一身份认证密码
+    """
+    if not config_file_name:
+        config_file_name = 'local_config.ini' if os.path.exists(
+            'local_config.ini') else 'config.ini'
+    # 以绝对路径作为缓存的键，不同的配置文件分别缓存
+    return _load_config(os.path.abspath(config_file_name))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config(path: str):
+    config = configparser.ConfigParser()
+    config.read(path)
+    return config['ACCOUNT']['username'], config['ACCOUNT']['password']
@@ -7,7 +7,8 @@ get_captcha_in_undergraduate_course_system()函数获取一张本科生选课系
 
 使用方法：
 1. 配置账户信息：在`config.ini`中填入一卡通号和密码（不需要引号）；
-2. 运行本文件，依次得到研究生素质讲座系统中使用的验证码，还有本科生选课系统中的验证码。
+2. 运行本文件，并行获取研究生素质讲座系统中使用的验证码和本科生选课系统中的验证码，然后依次显示；
+   设置环境变量`HEADLESS=1`时不显示，而是直接保存为`captcha_0.jpg`、`captcha_1.jpg`（无需导入matplotlib）。
 
 提示：
 本科生账号无权限访问研究生素质讲座应用，会在POST这一步返回403错误。
@@ -19,18 +20,23 @@ License: GPL-3.0 License
 """
 
 import base64
-import configparser
 import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from pathlib import Path
 
-import matplotlib.pyplot as plt
 import requests
-from PIL import Image
 
 sys.path.append('..')
-from seu_auth import seu_login
+from _config import load_config
+from seu_auth import SSLContextAdapter, json_loads, seu_login
+
+# 本科生选课系统无需登录，复用同一个session以保持长连接，避免每次请求都重新握手
+_UGRAD_SESSION = requests.Session()
+_UGRAD_SESSION.mount('https://',
+                     SSLContextAdapter(pool_connections=4, pool_maxsize=8))
 
 
 def login_postgraduate_lecture_system(username: str, password: str):
@@ -74,10 +80,11 @@ def get_captcha_in_postgraduate_lecture_system(session):
     """
     try:
         res = session.post(
-            url=f'https://ehall.seu.edu.cn/gsapp/sys/jzxxtjapp/hdyy/vcode.do?_={int(time.time() * 1000)}')
+            url=f'https://ehall.seu.edu.cn/gsapp/sys/jzxxtjapp/hdyy/vcode.do?_={time.time_ns() // 1_000_000}')
         if res.status_code != 200:
             raise Exception(f'POST请求失败[{res.status_code}, {res.reason}]')
-        img = base64.b64decode(res.json()['result'].split(',')[1])
+        data_url = json_loads(res.content)['result']
+        img = base64.b64decode(data_url.split(',')[1])
         print('获取验证码成功')
         return img
     except Exception as e:
@@ -92,11 +99,12 @@ def get_captcha_in_undergraduate_course_system():
         img: 验证码图片
     """
     try:
-        res = requests.post(
+        res = _UGRAD_SESSION.post(
             url='https://newxk.urp.seu.edu.cn/xsxk/auth/captcha', verify=False)
         if res.status_code != 200:
             raise Exception(f'POST请求失败[{res.status_code}, {res.reason}]')
-        img = base64.b64decode(res.json()['data']['captcha'].split(',')[1])
+        data_url = json_loads(res.content)['data']['captcha']
+        img = base64.b64decode(data_url.split(',')[1])
         print('获取验证码成功')
         return img
     except Exception as e:
@@ -106,27 +114,30 @@ def get_captcha_in_undergraduate_course_system():
 
 if __name__ == '__main__':
     # 读取配置文件，使用时须在`config.ini`中填入一卡通号和密码
-    config = configparser.ConfigParser()
-    config_file_name = 'local_config.ini' if os.path.exists(
-        'local_config.ini') else 'config.ini'
-    config.read(config_file_name)
-    username = config['ACCOUNT']['username']
-    password = config['ACCOUNT']['password']
-
-    # 登录研究生素质讲座系统
-    session = login_postgraduate_lecture_system(username, password)
-    # 获取验证码
-    img = get_captcha_in_postgraduate_lecture_system(session)
-    # 显示
-    img = Image.open(BytesIO(img))
-    plt.imshow(img)
-    plt.axis('off')
-    plt.show()
-
-    # 获取本科生选课系统验证码
-    img = get_captcha_in_undergraduate_course_system()
-    # 显示
-    img = Image.open(BytesIO(img))
-    plt.imshow(img)
-    plt.axis('off')
-    plt.show()
+    username, password = load_config()
+
+    # 两个系统的验证码获取互不依赖（且不在同一个host），并行执行：
+    # 一个线程登录研究生素质讲座系统后获取验证码，另一个线程直接获取本科生选课系统验证码
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        pg_future = executor.submit(
+            lambda: get_captcha_in_postgraduate_lecture_system(
+                login_postgraduate_lecture_system(username, password)))
+        ug_future = executor.submit(get_captcha_in_undergraduate_course_system)
+        imgs = [pg_future.result(), ug_future.result()]
+
+    # 无界面运行时直接保存图片，跳过matplotlib（导入耗时较长）
+    if os.environ.get('HEADLESS'):
+        for i, img in enumerate(imgs):
+            if img:
+                Path(f'captcha_{i}.jpg').write_bytes(img)
+    # 依次显示
+    else:
+        import matplotlib.pyplot as plt
+
+        for img in imgs:
+            if not img:
+                continue
+            # 由matplotlib直接解码，不再单独构造PIL Image对象
+            plt.imshow(plt.imread(BytesIO(img), format='jpeg'))
+            plt.axis('off')
+            plt.show()
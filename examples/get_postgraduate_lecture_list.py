@@ -16,12 +16,11 @@ Date: 2023/11/03
 License: GPL-3.0 License
 """
 
-import configparser
-import os
 import sys
 
 sys.path.append('..')
-from seu_auth import seu_login
+from _config import load_config
+from seu_auth import json_loads, seu_login
 
 
 def get_postgraduate_lecture_list(username: str, password: str):
@@ -57,7 +56,7 @@ def get_postgraduate_lecture_list(username: str, password: str):
             })
         if res.status_code != 200:
             raise Exception(f'POST请求失败[{res.status_code}, {res.reason}]')
-        lecture_list = res.json()['datas']['hdxxxs']['rows']
+        lecture_list = json_loads(res.content)['datas']['hdxxxs']['rows']
         print('获取讲座列表成功')
         return session, lecture_list
     except Exception as e:
@@ -67,12 +66,7 @@ def get_postgraduate_lecture_list(username: str, password: str):
 
 if __name__ == '__main__':
     # 读取配置文件，使用时须在`config.ini`中填入一卡通号和密码
-    config = configparser.ConfigParser()
-    config_file_name = 'local_config.ini' if os.path.exists(
-        'local_config.ini') else 'config.ini'
-    config.read(config_file_name)
-    username = config['ACCOUNT']['username']
-    password = config['ACCOUNT']['password']
+    username, password = load_config()
     # 获取讲座列表
     session, lecture_list = get_postgraduate_lecture_list(username, password)
     print(lecture_list)  # 为空时不一定是获取失败，可能是目前没有讲座信息，建议手动访问网页确认
@@ -12,15 +12,18 @@ Email: gol3vka@163.com
 Date: 2023/08/27
 License: GPL-3.0 License
 """
-import configparser
-import os
+import re
 import sys
 
-from bs4 import BeautifulSoup
-
 sys.path.append('..')
+from _config import load_config
 from seu_auth import seu_login
 
+# 第二课堂页面<title>标签的data-m属性即为用户id
+_TITLE_RE = re.compile(rb'<title[^>]*\bdata-m="([^"]+)"', re.I)
+# <title>位于<head>中，一般出现在页面开头，优先只扫描这一范围
+_TITLE_SCAN_SIZE = 4096
+
 
 def get_dekt_user_id(username: str, password: str):
     """获取第二课堂用户id，用于后续访问第二课堂其他服务。
@@ -44,7 +47,10 @@ def get_dekt_user_id(username: str, password: str):
             raise Exception('获取重定向url失败')
 
         # 更新Headers。UA必填，其他目前无所谓
-        session.headers = {
+        # 在原有headers上更新而不是整体替换，保留requests默认的`Accept-Encoding: gzip, deflate`，
+        # 使服务器返回压缩后的页面；登录用的`Content-Type: application/json`不再需要
+        session.headers.pop('Content-Type', None)
+        session.headers.update({
             # 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;'
             #           'q=0.8,application/signed-exchange;v=b3;q=0.7',
             # 'Accept-Encoding': 'gzip, deflate',
@@ -56,27 +62,19 @@ def get_dekt_user_id(username: str, password: str):
             'User-Agent':
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
             'Chrome/115.0.0.0 Safari/537.36'
-        }
+        })
 
         # 访问第二课堂页面，获取用户id
         res = session.get(url=redirect_url, verify=False)
         if res.status_code != 200:
             raise Exception(f'访问第二课堂失败[{res.status_code}, {res.reason}]')
 
-        # 使用BeautifulSoup解析html
-        soup = BeautifulSoup(res.text, 'html.parser')
-        if not soup.title:
-            raise Exception('BeautifulSoup解析失败')
-        user_id = soup.title['data-m']
-        if not user_id:
-            raise Exception('BeautifulSoup解析失败')
-        # # 或者使用正则表达式（需要在文件头添加import re）
-        # pattern = r'<title.*?data-m="(.*?)".*?>'
-        # match = re.search(pattern, res.text)
-        # if match:
-        #     user_id = match.group(1)
-        # else:
-        #     raise Exception('正则解析失败')
+        # 使用正则表达式直接从响应字节中匹配，无需构建完整的DOM树
+        match = _TITLE_RE.search(res.content, 0, _TITLE_SCAN_SIZE) or \
+            _TITLE_RE.search(res.content)
+        if not match:
+            raise Exception('正则解析失败')
+        user_id = match.group(1).decode()
         print('登录第二课堂成功，用户ID：', user_id)
         return session, user_id
     except Exception as e:
@@ -86,12 +84,7 @@ def get_dekt_user_id(username: str, password: str):
 
 if __name__ == '__main__':
     # 读取配置文件，使用时须在`config.ini`中填入一卡通号和密码
-    config = configparser.ConfigParser()
-    config_file_name = 'local_config.ini' if os.path.exists(
-        'local_config.ini') else 'config.ini'
-    config.read(config_file_name)
-    username = config['ACCOUNT']['username']
-    password = config['ACCOUNT']['password']
+    username, password = load_config()
     # 获取第二课堂用户id
     session, user_id = get_dekt_user_id(username, password)
     print(user_id)
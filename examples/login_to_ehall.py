@@ -12,12 +12,12 @@ Email: gol3vka@163.com
 Date: 2023/08/27
 License: GPL-3.0 License
 """
-import configparser
-import os
 import sys
+import time
 
 sys.path.append('..')
-from seu_auth import seu_login
+from _config import load_config
+from seu_auth import json_loads, seu_login
 
 
 def login_to_ehall(username: str, password: str):
@@ -41,7 +41,10 @@ def login_to_ehall(username: str, password: str):
             raise Exception('获取重定向url失败')
 
         # 更新Headers。UA必填，其他目前无所谓
-        session.headers = {
+        # 在原有headers上更新而不是整体替换，保留requests默认的`Accept-Encoding: gzip, deflate`，
+        # 使服务器返回压缩后的页面；登录用的`Content-Type: application/json`不再需要
+        session.headers.pop('Content-Type', None)
+        session.headers.update({
             # 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;'
             #           'q=0.8,application/signed-exchange;v=b3;q=0.7',
             # 'Accept-Encoding': 'gzip, deflate',
@@ -53,7 +56,7 @@ def login_to_ehall(username: str, password: str):
             'User-Agent':
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) '
             'Chrome/115.0.0.0 Safari/537.36'
-        }
+        })
 
         # 访问网上办事服务大厅首页
         res = session.get(url=redirect_url, verify=False)
@@ -61,14 +64,15 @@ def login_to_ehall(username: str, password: str):
             raise Exception('访问网上办事服务大厅失败')
 
         # 获取用户身份信息，检查是否登录成功
-        user_info_url = 'http://ehall.seu.edu.cn/jsonp/userDesktopInfo.json?type=&_=1693121329211'
+        user_info_url = f'http://ehall.seu.edu.cn/jsonp/userDesktopInfo.json?type=&_={time.time_ns() // 1_000_000}'
         res = session.get(url=user_info_url)
         if res.status_code != 200:
             raise Exception(f'无法获取用户身份信息[{res.status_code}, {res.reason}]')
-        if 'userId' in res.json():
-            if res.json()['userId'] == username:
+        user_info = json_loads(res.content)
+        if 'userId' in user_info:
+            if user_info['userId'] == username:
                 # 会打印姓名用于核对账户信息，如不需要可注释掉
-                print('登录网上办事服务大厅成功，用户姓名：', res.json()['userName'])
+                print('登录网上办事服务大厅成功，用户姓名：', user_info['userName'])
             else:
                 raise Exception('ID不匹配')
         else:
@@ -81,11 +85,6 @@ def login_to_ehall(username: str, password: str):
 
 if __name__ == '__main__':
     # 读取配置文件，使用时须在`config.ini`中填入一卡通号和密码
-    config = configparser.ConfigParser()
-    config_file_name = 'local_config.ini' if os.path.exists(
-        'local_config.ini') else 'config.ini'
-    config.read(config_file_name)
-    username = config['ACCOUNT']['username']
-    password = config['ACCOUNT']['password']
+    username, password = load_config()
     # 登录到网上办事服务大厅
     session = login_to_ehall(username, password)
@@ -13,11 +13,10 @@ Date: 2023/11/05
 License: GPL-3.0 License
 """
 
-import configparser
-import os
 import sys
 
 sys.path.append('..')
+from _config import load_config
 from seu_auth_mobile import seu_login
 
 
@@ -57,12 +56,7 @@ def query_seu_points(username: str, password: str):
 
 if __name__ == '__main__':
     # 读取配置文件，使用时须在`config.ini`中填入一卡通号和密码
-    config = configparser.ConfigParser()
-    config_file_name = 'local_config.ini' if os.path.exists(
-        'local_config.ini') else 'config.ini'
-    config.read(config_file_name)
-    username = config['ACCOUNT']['username']
-    password = config['ACCOUNT']['password']
+    username, password = load_config()
     # 获取东豆余额
     session, user_points = query_seu_points(username, password)
     print(user_points)
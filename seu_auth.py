@@ -1,6 +1,7 @@
 """使用requests模拟登录新版东南大学统一身份认证平台（https://auth.seu.edu.cn/dist/#/dist/main/login）
 
 函数说明：
+SSLContextAdapter类为连接池内共用SSLContext的HTTPAdapter，new_session()中会自动挂载；
 init_ocr()函数用于初始化OCR识别器（处理验证码）；
 new_session()函数用于创建一个具有必要headers的seesion；
 is_captcha_required()函数用于在登录前检查是否需要验证码；
@@ -22,27 +23,57 @@ License: GPL-3.0 License
 """
 
 import base64
-import json
-from datetime import datetime
-from io import BytesIO
+import functools
+import ssl
+import time
 from urllib.parse import unquote
 
-import ddddocr
 import requests
-from Crypto.Cipher import PKCS1_v1_5
-from Crypto.PublicKey import RSA
-from PIL import Image
+import urllib3
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.serialization import load_pem_public_key
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    # orjson为可选依赖，直接解析bytes且速度更快，未安装时回退到标准库（其他模块与示例均从此处导入）
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+class SSLContextAdapter(HTTPAdapter):
+    """连接池内共用同一个SSLContext（不校验证书）的HTTPAdapter，可挂载到任意session上。
+
+    urllib3在建立连接时会修改SSLContext的校验设置，因此每个adapter各自创建SSLContext，不在adapter之间共享。
+    """
+
+    def init_poolmanager(self, *args, **kwargs):
+        ssl_context = ssl.create_default_context()
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+        kwargs['ssl_context'] = ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+
+# 加载OCR模型耗时较长，只初始化一次，之后的登录复用同一个识别器
+_OCR_SINGLETON = None
 
 
 def init_ocr():
-    """初始化OCR识别器。
+    """初始化OCR识别器（首次调用时创建，之后返回同一个对象）。
 
     Returns:
         ocr: DdddOcr对象
     """
-    ocr = ddddocr.DdddOcr()
-    ocr.set_ranges(1)
-    return ocr
+    global _OCR_SINGLETON
+    if _OCR_SINGLETON is None:
+        # 导入ddddocr会同时加载onnxruntime，耗时较长，仅在需要OCR时导入
+        import ddddocr
+
+        _OCR_SINGLETON = ddddocr.DdddOcr()
+        _OCR_SINGLETON.set_ranges(1)
+    return _OCR_SINGLETON
 
 
 def new_session():
@@ -70,6 +101,17 @@ def new_session():
         'Chrome/115.0.0.0 Safari/537.36'
     }
     session.headers.update(headers)
+    # 登录过程中的请求都发往同一host，显式配置连接池，并对网关错误做有限次重试
+    # （Retry默认不重试POST等非幂等请求）
+    adapter = SSLContextAdapter(pool_connections=4,
+                                pool_maxsize=10,
+                                max_retries=Retry(
+                                    total=2,
+                                    backoff_factor=0.2,
+                                    status_forcelist=[502, 503, 504],
+                                    raise_on_status=False))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
     return session
 
 
@@ -87,7 +129,8 @@ def is_captcha_required(session):
     res = session.get(url=url, verify=False)
     if res.status_code != 200:
         raise Exception(f'[{res.status_code}, {res.reason}]')
-    return res.json()['code'] == 4000 and '不需要' not in res.json()['info']
+    body = json_loads(res.content)
+    return body['code'] == 4000 and '不需要' not in body['info']
 
 
 def solve_captcha(session, ocr=None, manual=False):
@@ -103,32 +146,41 @@ def solve_captcha(session, ocr=None, manual=False):
     """
     try:
         url = 'https://auth.seu.edu.cn/auth/casback/getCaptcha'
+        # 验证码图片本身已经是压缩格式，不需要再进行gzip等传输压缩
+        headers = {'Accept': 'image/*', 'Accept-Encoding': 'identity'}
 
-        res = session.get(url=url, verify=False)
+        res = session.get(url=url, headers=headers, verify=False)
         if res.status_code != 200:
             raise Exception(f'[{res.status_code}, {res.reason}]')
         print('获取验证码成功')
-        img = Image.open(BytesIO(res.content))
 
         # 手动输入
         if manual:
-            img.show()
+            # 仅在需要显示时才导入PIL并解码
+            from io import BytesIO
+
+            from PIL import Image
+
+            Image.open(BytesIO(res.content)).show()
             result = ''
             # NOTE: 目前为4位纯字母，如有变动请修改
             while len(result) != 4 or not result.isalpha():
                 result = input('请输入验证码：')
         # OCR识别
         else:
+            # numpy随ddddocr（onnxruntime）一同安装，版本由其决定，不在requirements.txt中单独指定
+            import numpy as np
+
             if not ocr:
                 ocr = init_ocr()
             result = ''
             # NOTE: 同上
             while len(result) != 4 or not result.isalpha():
-                result = ocr.classification(img, probability=True)
-                s = ''
-                for i in result['probability']:
-                    s += result['charsets'][i.index(max(i))]
-                result = s
+                # ddddocr可直接接收图片原始字节，无需先解码为PIL Image
+                result = ocr.classification(res.content, probability=True)
+                # 每一位取概率最大的字符
+                indices = np.asarray(result['probability']).argmax(axis=1)
+                result = ''.join(result['charsets'][i] for i in indices)
             print('验证码识别结果：', result)
         return result
     except Exception as e:
@@ -153,7 +205,7 @@ def get_pub_key(session):
         if res.status_code != 200:
             raise Exception(f'[{res.status_code}, {res.reason}]')
 
-        pub_key = res.json()['publicKey']
+        pub_key = json_loads(res.content)['publicKey']
         print('获取RSA公钥成功')
         return pub_key
     except Exception as e:
@@ -161,6 +213,23 @@ def get_pub_key(session):
         return None
 
 
+# base64url -> base64
+_B64URL_TO_B64 = str.maketrans('-_', '+/')
+
+
+@functools.lru_cache(maxsize=32)
+def _import_rsa_key(pem: str):
+    """解析PEM格式的RSA公钥，结果按公钥缓存，同一公钥无需重复解析。
+
+    Args:
+        pem: PEM格式的RSA公钥
+
+    Returns:
+        rsa_key: RSA公钥对象
+    """
+    return load_pem_public_key(pem.encode())
+
+
 def rsa_encrypt(message: str, pub_key: str):
     """使用服务器返回的公钥对用户密码进行RSA加密。
 
@@ -172,13 +241,18 @@ def rsa_encrypt(message: str, pub_key: str):
         cipher_text: 加密后的用户密码（base64）
     """
     try:
-        pub_key = pub_key.replace('-', '+').replace('_',
-                                                    '/')  # base64url -> base64
-        pub_key = '-----BEGIN PUBLIC KEY-----\n' + pub_key + '\n-----END PUBLIC KEY-----'
-        rsa_key = RSA.importKey(pub_key)
-        cipher = PKCS1_v1_5.new(rsa_key)
-        cipher_text = base64.b64encode(cipher.encrypt(
-            message.encode()))  # base64
+        pub_key = pub_key.strip()
+        if pub_key.startswith('-----BEGIN PUBLIC KEY-----'):
+            # 已是PEM格式，直接使用
+            pem = pub_key
+        else:
+            # 仅在含有base64url字符时转换为标准base64
+            if '-' in pub_key or '_' in pub_key:
+                pub_key = pub_key.translate(_B64URL_TO_B64)
+            pem = f'-----BEGIN PUBLIC KEY-----\n{pub_key}\n-----END PUBLIC KEY-----'
+        cipher_text = base64.b64encode(
+            _import_rsa_key(pem).encrypt(message.encode(),
+                                         padding.PKCS1v15()))  # base64
 
         print('RSA加密成功')
         return cipher_text.decode()
@@ -200,7 +274,7 @@ def seu_login(username: str,
         password: 用户密码（明文）
         service_url: 所要访问服务的url，如`http://ehall.seu.edu.cn`
         session: 登录前的session，若未提供则新建
-        ocr: OCR识别器，若未提供且未指定手动输入验证码则新建
+        ocr: OCR识别器，若未提供且未指定手动输入验证码，则在需要验证码时创建
         manual_captcha: 是否手动输入验证码，默认使用OCR识别
 
     Returns:
@@ -209,7 +283,6 @@ def seu_login(username: str,
     """
     print('[seu_login]')
     session = new_session() if not session else session
-    ocr = init_ocr() if not ocr and not manual_captcha else ocr
     captcha_required = True
     captcha_correct = False
 
@@ -219,7 +292,7 @@ def seu_login(username: str,
         captcha_result = solve_captcha(
             session, ocr, manual_captcha) if captcha_required else ''
 
-        # 获取RSA公钥
+        # 获取RSA公钥，响应中的CHIPER_UID须与公钥匹配，保持原有请求顺序依次发起
         pub_key = get_pub_key(session)
         if not pub_key:
             return None, None
@@ -244,27 +317,33 @@ def seu_login(username: str,
                 'wxBinded': False,
             }
 
-            res = session.post(url=url, data=json.dumps(data), verify=False)
+            res = session.post(url=url, json=data, verify=False)
             if res.status_code != 200:
                 raise Exception(f'[{res.status_code}, {res.reason}]')
 
+            # 只解析一次响应体，后续直接读取字典
+            body = json_loads(res.content)
+
             # 处理验证码错误
-            if not res.json()['success'] and '验证码' in res.json()['info']:
+            if not body['success'] and '验证码' in body['info']:
                 print('验证码错误，重试')
                 continue
 
             # 其他错误
-            if not res.json()['success']:
-                raise Exception(res.json()['info'])
+            if not body['success']:
+                raise Exception(body['info'])
 
             print('认证成功')
 
             # 未指定服务，无需重定向，直接返回session
-            if res.json()['redirectUrl'] is None:
+            if body['redirectUrl'] is None:
                 return session, None
 
             # 指定服务，返回重定向url（含ticket）
-            redirect_url = unquote(res.json()['redirectUrl'])
+            # 不含转义字符时无需解码
+            redirect_url = body['redirectUrl']
+            if '%' in redirect_url:
+                redirect_url = unquote(redirect_url)
             return session, redirect_url
         except Exception as e:
             print('认证失败，错误信息：', e)
@@ -280,7 +359,7 @@ def seu_logout(session):
     try:
         url = 'https://auth.seu.edu.cn/auth/casback/casLogout'
         res = session.post(url=url, verify=False)
-        if res.status_code != 200 or not res.json()['success']:
+        if res.status_code != 200 or not json_loads(res.content)['success']:
             raise Exception(f'[{res.status_code}, {res.reason}]')
         print('退出登录成功')
     except Exception as e:
@@ -288,6 +367,9 @@ def seu_logout(session):
 
 
 if __name__ == '__main__':
+    # 所有请求都不校验证书，运行本文件时关闭InsecureRequestWarning（作为模块导入时不影响调用方）
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
     username = '【一卡通号】'
     password = '【密码】'
 
@@ -309,9 +391,9 @@ if __name__ == '__main__':
         session.get(url=redirect_url, verify=False)
         res = session.get(
             url=
-            f'http://ehall.seu.edu.cn/jsonp/userDesktopInfo.json?type=&_={int(datetime.now().timestamp())}',
+            f'http://ehall.seu.edu.cn/jsonp/userDesktopInfo.json?type=&_={time.time_ns() // 1_000_000_000}',
             verify=False)
-        print(res.json())
+        print(json_loads(res.content))
 
     # 退出登录
     seu_logout(session)
@@ -6,7 +6,7 @@ seu_login()函数用于发起登录请求，返回成功登录的session。包
 
 使用方法：
 1. 导入seu_login()函数；
-2. 调用seu_login()函数，传入一卡通号、密码，获取session；
+2. 调用seu_login()函数，传入一卡通号、密码、session（可选），获取session；
 3. 使用session访问其他移动端应用。
 
 Author: Golevka2001 (https://github.com/Golevka2001)
@@ -15,10 +15,10 @@ Date: 2023/11/05
 License: GPL-3.0 License
 """
 
-import json
-
 import requests
 
+from seu_auth import json_loads
+
 
 def get_user_info(session: requests.Session):
     """获取已登录用户的身份信息（用于检查是否成功登录）。
@@ -37,27 +37,29 @@ def get_user_info(session: requests.Session):
         if res.status_code != 200:
             raise Exception(f'[{res.status_code}, {res.reason}]')
 
-        if res.json()['result'] != '1' or res.json()['data'] is None:
+        body = json_loads(res.content)
+        if body.get('result') != '1' or body.get('data') is None:
             raise Exception('返回数据异常')
 
-        return res.json()['data']
+        return body['data']
     except Exception as e:
         print('获取用户信息失败，错误信息：', e)
         return None
 
 
-def seu_login(username: str, password: str):
+def seu_login(username: str, password: str, session=None):
     """向移动端身份认证平台发起登录请求（注：用户名/密码错误对应的状态码是：401, Unauthorized）
 
     Args:
         username: 一卡通号
         password: 登录密码
+        session: 登录前的session，若未提供则新建（传入已有session可复用其连接池）
 
     Returns:
         session: 登录成功后的session
     """
     try:
-        session = requests.Session()
+        session = requests.Session() if not session else session
         # Headers有没有都行
         # headers = {
         #     'Connection': 'Keep-Alive',
@@ -85,15 +87,14 @@ def seu_login(username: str, password: str):
             raise Exception(f'[{res.status_code}, {res.reason}]')
 
         # 手动更新sso-cookies，用于后续访问其他应用
-        sso_cookies = json.loads(res.headers['ssoCookie'])  # str -> dict
-        for cookie in sso_cookies:
+        for cookie in json_loads(res.headers['ssoCookie']):  # str -> list
             session.cookies.set(cookie['cookieName'], cookie['cookieValue'])
 
-        res = get_user_info(session)
-        if res is not None:
-            if res['uxid'] != username:
+        user_info = get_user_info(session)
+        if user_info is not None:
+            if user_info['uxid'] != username:
                 raise Exception('返回数据异常')
-            print('认证成功，用户姓名：', res['username'])
+            print('认证成功，用户姓名：', user_info['username'])
         return session
     except Exception as e:
         print('登录失败，错误信息：', e)
@@ -7,7 +7,7 @@ seu_login()函数用于发起登录请求，返回成功登录的session。包
 
 使用方法：
 1. 导入seu_login()函数；
-2. 调用seu_login()函数，传入一卡通号、密码，获取session；
+2. 调用seu_login()函数，传入一卡通号、密码、session（可选），获取session；
 3. 使用session访问其他页面。
 
 Author: Golevka2001 (https://github.com/Golevka2001)
@@ -16,21 +16,79 @@ Date: 2023/08/31
 License: GPL-3.0 License
 """
 
-import js2py
+import base64
+import html
+import logging
+import random
+import re
+
 import requests
-from bs4 import BeautifulSoup
+import soupsieve
+from bs4 import BeautifulSoup, SoupStrainer
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+logger = logging.getLogger(__name__)
+
+# 登录页面中的隐藏表单字段，及其中的属性
+_HIDDEN_INPUT_RE = re.compile(rb'<input\b[^>]*?\btype="hidden"[^>]*>', re.I)
+_ATTR_RE = re.compile(rb'([\w-]+)="([^"]*)"')
+
+# 登录成功页面中的用户姓名（`.auth_username span span`），用于跳过DOM解析的快速路径
+_NAME_RE = re.compile(
+    rb'class="[^"]*\bauth_username\b[^"]*"[^>]*>\s*<span[^>]*>\s*<span[^>]*>([^<]*)</span>'
+)
+
+# 登录结果页面中只需解析用户姓名（.auth_username）或错误信息（#msg）所在的片段
+_NAME_STRAINER = SoupStrainer(class_=re.compile(r'\bauth_username\b'))
+_MSG_STRAINER = SoupStrainer(id='msg')
+_NAME_SELECTOR = soupsieve.compile('.auth_username span span')
+_MSG_SELECTOR = soupsieve.compile('#msg')
+_HIDDEN_SELECTOR = soupsieve.compile('[tabid="01"] input[type="hidden"]')
+
+# 登录页面encrypt.js中生成随机字符串所用的字符集
+_AES_CHARS = 'ABCDEFGHJKMNPQRSTWXYZabcdefhijkmnprstwxyz2345678'
+
+
+def _random_string(length: int):
+    """生成指定长度的随机字符串，对应encrypt.js中的`_rds()`函数。"""
+    return ''.join(random.choices(_AES_CHARS, k=length))
+
+
+def _collect_login_data(hidden_items):
+    """从登录表单的隐藏字段中取出登录信息和密钥，同名字段与密钥均以首次出现的为准。
 
+    Args:
+        hidden_items: 各隐藏字段的属性字典
+
+    Returns:
+        key: 用于加密用户密码的密钥，未找到时为None
+        login_data: 登录所需的数据，username和password字段待填充
+    """
+    key = None
+    login_data = {'username': '', 'password': ''}
+    for attrs in hidden_items:
+        # 有name的为登录信息，没有name的（id="pwdDefaultEncryptSalt"）为密钥
+        if 'name' in attrs:
+            login_data.setdefault(attrs['name'], attrs.get('value', ''))
+        elif key is None:
+            key = attrs.get('value')
+    return key, login_data
 
-def get_login_data():
+
+def get_login_data(session=None):
     """从身份认证页面获取登录所需的ticket等，以及用于加密的密钥
 
+    Args:
+        session: 登录前的session，若未提供则新建（传入已有session可复用其连接池）
+
     Returns:
         session: 用于后续发起登录请求的session
         key: 用于加密用户密码的密钥
         login_data: 登录所需的数据，username和password字段待填充
     """
     try:
-        session = requests.Session()
+        session = requests.Session() if not session else session
         # Headers有没有都行
         # headers = {
         #     'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;'
@@ -53,35 +111,42 @@ def get_login_data():
         if res.status_code != 200:
             raise Exception(f'[{res.status_code}, {res.reason}]')
 
-        # 使用BeautifulSoup解析html
-        soup = BeautifulSoup(res.text, 'html.parser')
-        # 获取隐藏的表单数据
-        hidden_items = soup.select('[tabid="01"] input[type="hidden"]')
+        # 只需要登录表单（tabid="01"）中的几个隐藏字段，直接用正则在响应字节上提取，无需构建DOM树
+        content = res.content
+        start = content.find(b'tabid="01"')
+        end = content.find(b'</form>', start) if start != -1 else -1
+        hidden_items = _HIDDEN_INPUT_RE.findall(content, start,
+                                                end) if end != -1 else []
         """内容格式如下：
-        [<input name="lt" type="hidden" value="LT-5893590-xxxxxx-vXLP-cas"/>,
-        <input name="dllt" type="hidden" value="userNamePasswordLogin"/>,
-        <input name="execution" type="hidden" value="e1s1"/>,
-        <input name="_eventId" type="hidden" value="submit"/>,
-        <input name="rmShown" type="hidden" value="1"/>,
-        <input id="pwdDefaultEncryptSalt" type="hidden" value="iFo5xxxxxx4AhH">
-        </input>]
+        [b'<input name="lt" type="hidden" value="LT-5893590-xxxxxx-vXLP-cas"/>',
+        b'<input name="dllt" type="hidden" value="userNamePasswordLogin"/>',
+        b'<input name="execution" type="hidden" value="e1s1"/>',
+        b'<input name="_eventId" type="hidden" value="submit"/>',
+        b'<input name="rmShown" type="hidden" value="1"/>',
+        b'<input id="pwdDefaultEncryptSalt" type="hidden" value="iFo5xxxxxx4AhH">']
         """
-        # 密钥
-        key = str(hidden_items[-1]['value'])
-        # 登录信息
-        login_data = {'username': '', 'password': ''}
-        for item in hidden_items[:-1]:
-            login_data[str(item['name'])] = str(item['value'])
-
-        print('获取登录信息成功')
+        key, login_data = _collect_login_data({
+            name.decode(): html.unescape(value.decode())
+            for name, value in _ATTR_RE.findall(item)
+        } for item in hidden_items)
+        if not key:
+            # 页面结构与预期不符时，回退到完整解析页面并按CSS选择器提取
+            soup = BeautifulSoup(res.text, 'lxml')
+            key, login_data = _collect_login_data(
+                item.attrs for item in _HIDDEN_SELECTOR.select(soup))
+        if not key:
+            raise Exception('未找到密钥')
+
+        logger.info('获取登录信息成功')
         return session, key, login_data
     except Exception as e:
-        print('获取登录信息失败，错误信息：', e)
+        logger.error('获取登录信息失败，错误信息：%s', e)
         return None, None, None
 
 
 def aes_encrypt(message: str, key: str):
-    """使用获取到的密钥对用户密码进行AES加密，需要调用`encrypt.js`中的`encryptAES()`函数。
+    """使用获取到的密钥对用户密码进行AES加密，与登录页面`encrypt.js`中的`encryptAES()`函数一致：
+    在明文前拼接64位随机字符串，以随机的16位字符串作为IV，AES-CBC加密（PKCS7填充），结果为base64。
 
     Args:
         message: 用户密码（明文）
@@ -91,31 +156,40 @@ def aes_encrypt(message: str, key: str):
         cipher_text: 加密后的用户密码（base64）
     """
     try:
-        with open('./encrypt.js') as file:
-            js_obj = js2py.EvalJs()
-            js_obj.execute(file.read())
-            cipher = js_obj.encryptAES(message, key)
+        key = key.strip()
+        if not key:
+            return message
+        iv = _random_string(16).encode()
+        padder = padding.PKCS7(algorithms.AES.block_size).padder()
+        data = padder.update(
+            (_random_string(64) + message).encode()) + padder.finalize()
+        encryptor = Cipher(algorithms.AES(key.encode()),
+                           modes.CBC(iv)).encryptor()
+        cipher_text = base64.b64encode(
+            encryptor.update(data) + encryptor.finalize())
 
-            print('AES加密成功')
-            return cipher
+        logger.info('AES加密成功')
+        return cipher_text.decode()
     except Exception as e:
-        print('AES加密失败，错误信息', e)
+        logger.error('AES加密失败，错误信息：%s', e)
         return None
 
 
-def seu_login(username: str, password: str):
+def seu_login(username: str, password: str, session=None):
     """向统一身份认证平台发起登录请求。
 
     Args:
         username: 一卡通号
         password: 登录密码
+        session: 登录前的session，若未提供则新建
 
     Returns:
         session: 登录成功后的session
     """
     # 访问身份认证页面，获取登录信息
-    print('[seu_login]')
-    session, key, login_data = get_login_data()
+    logger.info('[seu_login]')
+    # 获取登录信息与提交登录请求使用同一个session，复用同一个keep-alive连接
+    session, key, login_data = get_login_data(session)
     if not session or not key or not login_data:
         return None, None
 
@@ -152,21 +226,32 @@ def seu_login(username: str, password: str):
         if res.status_code != 200:
             raise Exception(f'[{res.status_code}, {res.reason}]')
 
-        # 解析返回页面，判断是否登录成功
-        soup = BeautifulSoup(res.text, 'html.parser')
-        name_span = soup.select('.auth_username span span')
+        # 登录成功时页面中含有用户姓名，先直接在响应字节上匹配，命中则无需解析页面
+        match = _NAME_RE.search(res.content)
+        if match:
+            name = html.unescape(
+                match.group(1).decode(res.encoding or 'utf-8',
+                                      'replace')).strip()
+            logger.info('认证成功，用户姓名：%s', name)
+            return session
+
+        # 解析返回页面，判断是否登录成功（只构建所需片段的DOM树）
+        soup = BeautifulSoup(res.text, 'lxml', parse_only=_NAME_STRAINER)
+        name_span = _NAME_SELECTOR.select(soup)
         if len(name_span) == 0:
-            error_span = soup.select('#msg')[0]
+            soup = BeautifulSoup(res.text, 'lxml', parse_only=_MSG_STRAINER)
+            error_span = _MSG_SELECTOR.select(soup)[0]
             raise Exception(error_span.text.strip())
 
-        print('认证成功，用户姓名：', name_span[0].text.strip())
+        logger.info('认证成功，用户姓名：%s', name_span[0].text.strip())
         return session
     except Exception as e:
-        print('认证失败，错误信息', e)
+        logger.error('认证失败，错误信息：%s', e)
         return None
 
 
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     username = '【一卡通号】'
     password = '【密码】'
     session = seu_login(username, password)